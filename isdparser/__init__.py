@@ -4,7 +4,7 @@ __version__ = VERSION
 from . mappings import * 
 from .measures import Measure, CategoricalMeasure, Position, Section, \
     NumericMeasure, control_measures, mandatory_measures
-from .record import ISDRecord, ISDRecordFactory
+from .record import ISDRecord, ISDRecordFactory, ISDColumnarStore, default_factory
 
 __all__ = (
     'Measure', 
@@ -15,5 +15,7 @@ __all__ = (
     'control_measures', 
     'mandatory_measures',
     'ISDRecord', 
-    'ISDRecordFactory'
+    'ISDRecordFactory', 
+    'ISDColumnarStore',
+    'default_factory'
 )
\ No newline at end of file
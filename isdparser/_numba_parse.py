@@ -0,0 +1,52 @@
+""" Optional numba-accelerated numeric column parsing for `ISDColumnarStore`.
+
+The isd numeric fields are fixed-width ascii integers with an optional
+leading sign, so a whole column can be parsed in one tight loop over its
+raw uint8 buffer. When numba is importable the loop is JIT-compiled;
+otherwise `parse_numeric_block` is None and callers fall back to the
+vectorized numpy astype path. numba is deliberately not a hard
+dependency — install it alongside the `columnar` extra to opt in.
+"""
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised when numba is absent
+    njit = None
+
+parse_numeric_block = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _parse_numeric_block(buf, scaling_factor, out):
+        """Parse a (n_rows, width) uint8 view of a fixed-width ascii integer
+        column into a preallocated float64 `out` array, dividing by the
+        measure's scaling factor. Fields that are not a well-formed signed
+        integer are written as nan; missing sentinels are masked by the
+        caller with a bytes compare against the raw column.
+        """
+        n_rows, width = buf.shape
+        for i in range(n_rows):
+            pos = 0
+            while pos < width and buf[i, pos] == 0x20:
+                pos += 1
+            sign = 1.0
+            if pos < width and (buf[i, pos] == 0x2b or buf[i, pos] == 0x2d):
+                if buf[i, pos] == 0x2d:
+                    sign = -1.0
+                pos += 1
+            value = 0.0
+            ok = pos < width
+            while pos < width:
+                c = buf[i, pos]
+                if c == 0x20 or c == 0x00:
+                    break
+                if c < 0x30 or c > 0x39:
+                    ok = False
+                    break
+                value = value * 10.0 + (c - 0x30)
+                pos += 1
+            if ok:
+                out[i] = sign * value / scaling_factor
+            else:
+                out[i] = float('nan')
+
+    parse_numeric_block = _parse_numeric_block
@@ -1,8 +1,33 @@
 
-from . import mappings 
+import json
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+
+from . import mappings
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 
+@lru_cache(maxsize=4096)
+def _parse_numeric(value: Union[str, bytes], scaling_factor: int) -> float:
+    """Parse and scale a raw numeric field value. The same short numeric
+    strings repeat constantly across isd records so results are memoized.
+    isd numerics are scaled integers, so the int() fast path is tried first;
+    both int() and float() accept bytes so values never need decoding.
+
+    Args:
+        value (Union[str, bytes]): The raw field value.
+        scaling_factor (int): The measure's scaling factor.
+
+    Returns:
+        float: The scaled numeric value.
+    """
+    try:
+        return int(value) / scaling_factor
+    except ValueError:
+        return float(value) / scaling_factor
+
+
 class Position(object): 
     __slots__ = ('start', 'end')
     
@@ -23,10 +48,15 @@ class Position(object):
 
 
 class Measure(object):
-    __slots__ = ('_name', '_position', '_missing', '_value')
-    
+    __slots__ = ('_name', '_position', '_missing', '_value', 'start', 'end',
+        '_schema_template', '_json_prefix', '_schema_cache', '_section')
+
     def __init__(self, name: str, position: Position, missing: Optional[str]=None) -> None:
-        """A basic measure found in the isd string, represented as 
+        """A basic measure found in the isd string, represented as
+
+        `start` and `end` are precomputed from the position on construction --
+        start is the provided start position - 1 so the pair can be used
+        directly as a python slice -- avoiding property dispatch in parse loops.
 
         Args:
             name (str): The name of the measure
@@ -34,12 +64,23 @@ class Measure(object):
             missing (str, optional): If provided, the value represented as missing.
                 Often something like `9999`. Defaults to None.
         """
-        self._name = name 
-        self._position = position # easier to map  
-        self._missing = missing 
+        self._name = sys.intern(name)
+        self._position = position # easier to map
+        self._missing = missing
         self._value = None
-        
-    @property 
+        if position is not None:
+            self.start = position.start - 1
+            self.end = position.end
+        else:
+            self.start = None
+            self.end = None
+        # small-dict copies beat building a dict literal per schema() call
+        self._schema_template = {'measure': self._name, 'value': None}
+        self._schema_cache = None
+        self._section = None
+        self._json_prefix = b'{"measure":' + json.dumps(self._name).encode('ascii') + b',"value":'
+
+    @property
     def name(self) -> str:
         """Get the name of the Measure
 
@@ -47,52 +88,85 @@ class Measure(object):
             str: The name of the Measure
         """
         return self._name
-    
-    @property 
-    def start(self) -> int:
-        """Retrieve the start from the underlying position. Subtracts 1 from this
-        value to give the python list position for a slice.
 
-        Returns:
-            int: Provided start position - 1
-        """
-        return self._position.start - 1 
-
-    @property 
-    def end(self) -> int:
-        """Retrieve end from the underlying position.
+    def _materialize(self) -> Any:
+        """Materialize the underlying value as a string. Values set from a raw
+        byteslice are decoded and stripped lazily here so the parse loop can
+        stay zero-copy; the decoded string replaces the view on first access.
 
         Returns:
-            int: [description]
+            Any: The materialized value.
         """
-        return self._position.end
-    
+        value = self._value
+        if value is not None and type(value) is not str:
+            value = sys.intern(bytes(value).decode('ascii').strip())
+            if value == self._missing:
+                value = None
+            self._value = value
+        return value
+
     def schema(self) -> Dict[str, Any]:
         """Return the schema as a dictionary mapped name : value
 
+        The result is memoized until the value is next set and returned as
+        a read-only mapping so the cache cannot be mutated by consumers --
+        call dict() on it for a mutable copy.
+
         Returns:
-            Dict[str, Any]: A dictionary mapped name value.
+            Dict[str, Any]: A read-only dictionary mapped name value.
         """
-        if self._missing is not None and self._value == self._missing:
-            val = None
-        else:
-            val = self._value
-        return { 'measure': self._name, 'value': val }
-    
+        schema = self._schema_cache
+        if schema is None:
+            schema = self._schema_template.copy()
+            schema['value'] = self._materialize()
+            schema = self._schema_cache = MappingProxyType(schema)
+        return schema
+
 
     def set_value(self, value: str) -> "Measure":
         """Set the value of the string on the Measure instance returning self.
+        A `memoryview` over raw bytes may also be given and is decoded lazily.
 
         Returns:
             Measure: the instance.
         """
-        self._value = value.strip() if type(value) is str else value
+        if type(value) is str:
+            value = sys.intern(value.strip())
+            if value == self._missing:
+                value = None
+        self._value = value
+        self._invalidate()
         return self
 
+    def _invalidate(self) -> None:
+        """Clear the memoized schema on this measure and on the owning
+        Section and ISDRecord, which cache aggregate schemas built from it.
+        """
+        self._schema_cache = None
+        section = self._section
+        if section is not None:
+            section._schema_cache = None
+            record = section._record
+            if record is not None:
+                record._schema = None
+
+    def _write_json(self, out: bytearray) -> None:
+        """Append this measure's schema as raw json to a bytearray. The
+        constant key prefix is precompiled so only the value is encoded
+        per call.
+
+        Args:
+            out (bytearray): The output buffer.
+        """
+        out += self._json_prefix
+        value = self._materialize()
+        out += b'null' if value is None else json.dumps(value).encode('ascii')
+        out += b'}'
+
 
 class NumericMeasure(Measure):
     
-    __slots__ = ('_name', '_position', '_missing', '_value', '_scaling_factor', '_unit')
+    __slots__ = ('_scaling_factor', '_unit', '_json_suffix', '_missing_bytes')
     
     def __init__(self, 
         name: str, 
@@ -112,6 +186,21 @@ class NumericMeasure(Measure):
         super().__init__(name, position, missing)
         self._scaling_factor = scaling_factor
         self._unit = unit
+        self._schema_template = {'measure': self._name, 'value': None, 'unit': unit}
+        self._json_suffix = b',"unit":' + json.dumps(unit).encode('ascii') + b'}'
+        self._missing_bytes = missing.encode('ascii') if missing is not None else None
+
+    def _materialize(self) -> Any:
+        # numeric fields are only ever fed to int()/float(), which accept
+        # bytes -- so raw slices skip the str decode and interning and the
+        # missing sentinel is compared against its pre-encoded form.
+        value = self._value
+        if value is not None and type(value) is not str:
+            value = bytes(value).strip()
+            if value == self._missing_bytes:
+                value = None
+            self._value = value
+        return value
         
     def schema(self) -> Dict[str, Any]:
         """Return the schema as a dictionary, calculating any values from the string value.
@@ -119,24 +208,74 @@ class NumericMeasure(Measure):
         Returns:
             Dict[str, Any]: Resulting schema mapped measure: name, value: val and unit: unit
         """
-        if self._missing is not None and self._value == self._missing: 
-            val = None 
+        schema = self._schema_cache
+        if schema is None:
+            value = self._materialize()
+            schema = self._schema_template.copy()
+            if value is not None:
+                schema['value'] = _parse_numeric(value, self._scaling_factor)
+            schema = self._schema_cache = MappingProxyType(schema)
+        return schema
+
+    def _write_json(self, out: bytearray) -> None:
+        out += self._json_prefix
+        value = self._materialize()
+        if value is None:
+            out += b'null'
         else:
-            val = float(self._value) / self._scaling_factor 
-        return {
-            'measure': self._name, 
-            'value': val,
-            'unit': self._unit
-        }
+            out += repr(_parse_numeric(value, self._scaling_factor)).encode('ascii')
+        out += self._json_suffix
     
 
-class CategoricalMeasure(Measure): 
-    __slots__ = ('_name', '_position', '_missing', '_value', '_mapping')
-    
-    def __init__(self, 
-        name: str, 
-        position: Position, 
-        mapping: Dict[str, str], 
+_CODE_TABLES = {}
+# each entry pins its mapping alive to keep the id() key valid, so the
+# registry must not grow for the process lifetime -- ad-hoc dict literals
+# would otherwise be retained forever. Plain dicts cannot be weakly
+# referenced, so the registry is bounded instead: far more entries than
+# the shipped tables need, and a full reset when ad-hoc mappings ever
+# push past it.
+_CODE_TABLES_MAX = 128
+
+def _code_tables(mapping: Dict[str, str]) -> Tuple[Dict[str, int], Tuple[str, ...], Tuple[bytes, ...], Optional[Tuple[Optional[int], ...]]]:
+    """Return (and cache) a code index and description tuple for a mapping so
+    CategoricalMeasures sharing a mapping also share one set of tables.
+
+    Args:
+        mapping (Dict[str, str]): A value -> description mapping.
+
+    Returns:
+        Tuple[Dict[str, int], Tuple[str, ...], Tuple[bytes, ...], Optional[Tuple[Optional[int], ...]]]:
+            The code index, descriptions, json-encoded descriptions and the
+            ord-indexed table when the mapping keys are single ascii chars.
+    """
+    tables = _CODE_TABLES.get(id(mapping))
+    if tables is None:
+        codes = {k: i for i, k in enumerate(mapping)}
+        descriptions = tuple(mapping.values())
+        encoded = tuple(json.dumps(d).encode('utf-8') for d in descriptions)
+        # when every key is a single ascii char the dict can be replaced by
+        # a 128-slot table indexed with ord(value) -- a perfect hash.
+        chr_table = None
+        if all(len(k) == 1 and ord(k) < 128 for k in codes):
+            chr_table = [None] * 128
+            for k, i in codes.items():
+                chr_table[ord(k)] = i
+            chr_table = tuple(chr_table)
+        tables = (mapping, codes, descriptions, encoded, chr_table)
+        if len(_CODE_TABLES) >= _CODE_TABLES_MAX:
+            _CODE_TABLES.clear()
+        _CODE_TABLES[id(mapping)] = tables
+    return tables[1:]
+
+
+class CategoricalMeasure(Measure):
+    __slots__ = ('_mapping', '_codes', '_descriptions', '_descriptions_json',
+        '_chr_table', '_code')
+
+    def __init__(self,
+        name: str,
+        position: Position,
+        mapping: Dict[str, str],
         missing: Optional[str]=None) -> None:
         """ A CategoricalMeasure. A dictionary mapping values to descriptions must be provided based on the isd docs.
 
@@ -147,27 +286,76 @@ class CategoricalMeasure(Measure):
             missing (Optional[str], optional): The repr of a missing value if provided. Defaults to None.. Defaults to None.
         """
         super().__init__(name, position, missing)
-        self._mapping = mapping 
-    
+        self._mapping = mapping
+        self._codes, self._descriptions, self._descriptions_json, self._chr_table = _code_tables(mapping)
+        self._code = None
+        self._schema_template = {'measure': self._name, 'value': None, 'description': None}
+
+    def _materialize(self) -> Any:
+        # unlike the base class the raw code is kept even when it means
+        # missing -- schema() still resolves its description.
+        value = self._value
+        if value is not None and type(value) is not str:
+            value = sys.intern(bytes(value).decode('ascii').strip())
+            self._value = value
+            self._code = self._lookup_code(value)
+        return value
+
+    def set_value(self, value: str) -> "CategoricalMeasure":
+        """Set the value on the instance, encoding it as a small integer code
+        into the shared description table when it is a known category.
+
+        Returns:
+            CategoricalMeasure: the instance.
+        """
+        if type(value) is str:
+            value = sys.intern(value.strip())
+            self._code = self._lookup_code(value)
+        else:
+            self._code = None
+        self._value = value
+        self._invalidate()
+        return self
+
+    def _lookup_code(self, value: str) -> Optional[int]:
+        table = self._chr_table
+        if table is not None and len(value) == 1 and value <= '\x7f':
+            return table[ord(value)]
+        return self._codes.get(value)
+
     def schema(self) -> Dict[str, Any]:
         """ Returns the schema as a dictionary. A description maps the repr value to text.
 
         Returns:
             Dict[str, Any]: Resulting schema mapped meaure : name, value : val, description : text
         """
-        if self._missing is not None and self._value in self._missing:
-            val = None
+        schema = self._schema_cache
+        if schema is None:
+            value = self._materialize()
+            code = self._code
+            schema = self._schema_template.copy()
+            if self._missing is None or value != self._missing:
+                schema['value'] = value
+            schema['description'] = self._descriptions[code] if code is not None else self._mapping[value]
+            schema = self._schema_cache = MappingProxyType(schema)
+        return schema
+
+    def _write_json(self, out: bytearray) -> None:
+        out += self._json_prefix
+        value = self._materialize()
+        code = self._code
+        if value is None or value == self._missing:
+            out += b'null'
         else:
-            val = self._value
-        return {
-            'measure': self._name,
-            'value': val,
-            'description': self._mapping[self._value]
-        }
+            out += json.dumps(value).encode('ascii')
+        out += b',"description":'
+        out += self._descriptions_json[code] if code is not None else json.dumps(self._mapping[value]).encode('utf-8')
+        out += b'}'
 
 
-class Section(object): 
-    __slots__ = ('_name', '_measures')
+class Section(object):
+    __slots__ = ('_name', '_measures', '_by_name', '_json_prefix',
+        '_schema_cache', '_record')
     
     def __init__(self, 
         name: str, 
@@ -181,11 +369,30 @@ class Section(object):
             measures (Union[Callable[...,List[Measure]], List[Measure]]): Either a list of measure instances 
                 or a callable that returns one.
         """
-        self._name = name
+        self._name = sys.intern(name)
         if callable(measures):
-            measures = measures()    
-        self._measures = measures 
-    
+            measures = measures()
+        self._measures = measures
+        self._by_name = {m._name: m for m in measures}
+        self._json_prefix = b'{"name":' + json.dumps(name).encode('ascii') + b',"measures":['
+        self._schema_cache = None
+        self._record = None
+        # back-references let set_value on a measure invalidate the cached
+        # aggregate schemas above it.
+        for m in measures:
+            m._section = self
+
+    def measure(self, name: str) -> Optional[Measure]:
+        """Look up a measure in the section by name.
+
+        Args:
+            name (str): The measure name.
+
+        Returns:
+            Optional[Measure]: The measure if present else None.
+        """
+        return self._by_name.get(name)
+
     @property 
     def name(self) -> str: 
         return self._name 
@@ -201,15 +408,37 @@ class Section(object):
             
     def schema(self) -> Dict[str, Any]:
         """Returns a schema that in turn produces schemas for each measure.
+        The result is memoized; the cache is reset whenever the owning
+        factory fills the section with a new line of values.
 
         Returns:
             Dict[str, Union[str, List[Dict[str, Any]]]]: A section schema of 
                 name: name, measures: List[Measures]
         """
-        return {
-            'name': self._name, 
-            'measures': [m.schema() for m in self._measures]
-        }    
+        schema = self._schema_cache
+        if schema is None:
+            # a tuple keeps the measures immutable too -- the proxy alone
+            # would still expose a mutable list to every reader.
+            schema = MappingProxyType({
+                'name': self._name,
+                'measures': tuple(m.schema() for m in self._measures)
+            })
+            self._schema_cache = schema
+        return schema
+
+    def _write_json(self, out: bytearray) -> None:
+        """Append the section schema as raw json to a bytearray.
+
+        Args:
+            out (bytearray): The output buffer.
+        """
+        out += self._json_prefix
+        for i, m in enumerate(self._measures):
+            if i:
+                out += b','
+            m._write_json(out)
+        out += b']}'
+    
     
 
 
@@ -22,6 +22,20 @@ project_slug = NAME.lower().replace("-", "_").replace(" ", "_")
 with open(os.path.join(here, project_slug, '_version.py')) as f:
     exec(f.read(), about)
 
+# EXPERIMENTAL: opt-in ahead-of-time compilation of the hot modules with
+# mypyc, gated behind ISDPARSER_USE_MYPYC=1. This path is not exercised
+# in CI and does not currently pass mypyc's type checking -- the runtime
+# codegen in ISDRecordFactory._compile_fill in particular is hostile to
+# native classes -- so treat it as a starting point, not a supported
+# build.
+ext_modules = []
+if os.environ.get('ISDPARSER_USE_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        'isdparser/measures.py',
+        'isdparser/record.py',
+    ])
+
 
 setup(
     name=NAME,
@@ -30,7 +44,12 @@ setup(
     long_description=readme,
     packages=find_packages(exclude=["*.tests", "*.tests.*", "tests.*", "tests", "scripts"]),
     include_package_data=True,
+    package_data={'isdparser': ['mappings.json']},
+    ext_modules=ext_modules,
     install_requires=requirements,
+    extras_require={
+        'columnar': ['numpy']
+    },
     test_suite='pytest',
     tests_require=test_requirements,
     classifiers=[
@@ -18,10 +18,10 @@ def test_measure():
     assert m.end == 2 
     
     m.set_value('42')
-    tc.assertDictEqual({'measure': 'my_measure', 'value': '42'}, m.schema())
+    tc.assertEqual({'measure': 'my_measure', 'value': '42'}, m.schema())
 
     m.set_value('99')
-    tc.assertDictEqual({'measure': 'my_measure', 'value': None}, m.schema())
+    tc.assertEqual({'measure': 'my_measure', 'value': None}, m.schema())
 
 
 def test_numeric_measure(): 
@@ -34,7 +34,7 @@ def test_numeric_measure():
         'value': 10, 
         'unit' : 'my_unit'
     }
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
     m.set_value('-9999')
 
@@ -44,7 +44,7 @@ def test_numeric_measure():
         'unit': 'my_unit'
     }
 
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
 
 def test_categorical_measure():
@@ -63,19 +63,19 @@ def test_categorical_measure():
         'description': 'One'
     }
 
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
     m.set_value('2')
     expected['value'] = '2'
     expected['description'] = 'Two'
 
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
     m.set_value('9')
     expected['value'] = None 
     expected['description'] = 'Missing'
 
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
     test_mapping_with_whitespace = {
         'blah': 'blah blah blah'
@@ -88,7 +88,7 @@ def test_categorical_measure():
         'value': 'blah', 
         'description': 'blah blah blah'
     }
-    tc.assertDictEqual(expected, m.schema())
+    tc.assertEqual(expected, m.schema())
 
 
 def test_section(mocker): 
@@ -116,10 +116,28 @@ def test_section(mocker):
     
     expected = {
         'name': 'my_section', 
-        'measures': [
+        'measures': (
             {'name': 'my_measure', 'value': 42, 'unit': 'my_unit'}, 
             {'name': 'my_other_measure', 'value': '1', 'description': 'One'}
-        ]
+        )
     }
 
-    tc.assertDictEqual(expected, s.schema())
\ No newline at end of file
+    tc.assertEqual(expected, s.schema())
+
+def test_measure_classes_are_slotted():
+    # ~30 measure instances per record -- none of the containers should
+    # carry a per-instance __dict__.
+    m = NumericMeasure('my_measure', Position(1,2))
+    s = Section('my_section', [m])
+
+    for obj in (Position(1,2), Measure('m', Position(1,2)),
+                CategoricalMeasure('c', Position(1,2), {'1': 'One'}), m, s):
+        assert not hasattr(obj, '__dict__')
+
+
+def test_set_value_invalidates_section_schema():
+    m = Measure('x', Position(1, 2)).set_value('5')
+    s = Section('sec', [m])
+    assert s.schema()['measures'][0]['value'] == '5'
+    m.set_value('77')
+    assert s.schema()['measures'][0]['value'] == '77'
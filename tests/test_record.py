@@ -4,7 +4,7 @@ import unittest
 tc = unittest.TestCase()
 
 from isdparser.measures import Measure, Section
-from isdparser.record import ISDRecord, ISDRecordFactory
+from isdparser.record import ISDRecord, ISDRecordFactory, default_factory
 import copy
 
 def test_isdrecord(mocker): 
@@ -32,10 +32,10 @@ def test_isdrecord(mocker):
     expected = {
         'datestamp': d, 
         'identifier': 'my-id', 
-        'sections': [s.schema() for s in sections]
+        'sections': tuple(s.schema() for s in sections)
     }
 
-    tc.assertDictEqual(expected, record.schema())
+    tc.assertEqual(expected, record.schema())
 
 
 def test_isdrecordfactory_static_methods():
@@ -108,8 +108,116 @@ def test_isdrecordfactory_on_record_string(isd_record_strings_list):
     exp2['sections'][0]['measures'][2]['value'] = '20200301'
 
     expected = [exp0, exp1, exp2]
+    # record and section schemas hold their collections as immutable tuples
+    for e in expected:
+        for sec in e['sections']:
+            sec['measures'] = tuple(sec['measures'])
+        e['sections'] = tuple(e['sections'])
 
+    by_datestamp = {e['datestamp']: e for e in expected}
     for res in result:
-        datestamp = res.schema()['datestamp']
-        exp = list(filter(lambda x: x['datestamp'] == datestamp, expected))[0]
-        tc.assertDictEqual(exp, res.schema())
\ No newline at end of file
+        exp = by_datestamp[res.schema()['datestamp']]
+        tc.assertEqual(exp, res.schema())
+
+def test_isdrecordfactory_create_many(isd_record_strings_list):
+
+    expected = [ISDRecordFactory().create(line).schema() for line in isd_record_strings_list]
+
+    records = ISDRecordFactory().create_many(isd_record_strings_list)
+    assert len(records) == len(isd_record_strings_list)
+
+    for rec, exp in zip(records, expected):
+        tc.assertEqual(exp, rec.schema())
+
+    assert ISDRecordFactory().create_many([]) == []
+
+
+def test_isdrecordfactory_create_columnar(isd_record_strings_list):
+    np = pytest.importorskip('numpy')
+
+    expected = [ISDRecordFactory().create(line).schema() for line in isd_record_strings_list]
+
+    store = ISDRecordFactory().create_columnar(isd_record_strings_list)
+    assert len(store) == len(isd_record_strings_list)
+
+    assert store.identifiers == ['010230-99999'] * 3
+    assert store.column('date')[0] == b'20200101'
+
+    for i, exp in enumerate(expected):
+        tc.assertEqual(exp, store.schema(i))
+
+    for sch, exp in zip(store.schemas(), expected):
+        tc.assertEqual(exp, sch)
+
+
+def test_isdrecordfactory_make_epoch_timestamp():
+
+    fac = ISDRecordFactory
+    assert fac.make_epoch_timestamp('19700101', '0000') == 0
+    expected = int(fac.make_datestamp('20210101', '0115').timestamp())
+    assert fac.make_epoch_timestamp('20210101', '0115') == expected
+
+
+def test_isdrecord_to_json_bytes(isd_record_strings_list):
+    import json
+
+    record = ISDRecordFactory().create(isd_record_strings_list[0])
+    expected = dict(record.schema())
+    expected['datestamp'] = expected['datestamp'].isoformat()
+    # normalize the read-only section schemas to the plain structures
+    # json.loads produces
+    expected['sections'] = [
+        {'name': s['name'], 'measures': [dict(m) for m in s['measures']]}
+        for s in expected['sections']
+    ]
+
+    result = json.loads(record.to_json_bytes())
+    tc.assertDictEqual(expected, result)
+
+
+def test_isdcolumnarstore_numeric_values(isd_record_strings_list):
+    np = pytest.importorskip('numpy')
+
+    store = ISDRecordFactory().create_columnar(isd_record_strings_list)
+
+    lat = store.numeric_values('latitude')
+    assert lat.dtype == np.float64
+    assert list(lat) == [69.067, 69.067, 69.067]
+
+    # ceiling height is the missing sentinel in the fixture records
+    ceiling = store.numeric_values('sky_condition_observation_ceiling_height_dimension')
+    assert np.isnan(ceiling).all()
+
+    with pytest.raises(ValueError):
+        store.numeric_values('data_source_flag')
+
+
+def test_isdrecordfactory_create_from_file(tmp_path, isd_record_strings_list):
+
+    # the fixture strings wrap the additional-data section onto a second
+    # physical line; a real isd file holds one record per line.
+    lines = [''.join(l.split('\n')).replace('    ', '') for l in isd_record_strings_list]
+    path = tmp_path / 'isd-data'
+    path.write_bytes(('\n'.join(lines) + '\n').encode('ascii'))
+
+    expected = [ISDRecordFactory().create(line).schema() for line in isd_record_strings_list]
+
+    fac = ISDRecordFactory()
+    for record, exp in zip(fac.create_from_file(str(path)), expected):
+        tc.assertEqual(exp, record.schema())
+
+
+def test_default_factory_is_shared(isd_record_strings_list):
+    factory = default_factory()
+    assert factory is default_factory()
+
+    line = ''.join(isd_record_strings_list[0].split('\n')).replace('    ', '')
+    rec = factory.create(line)
+    assert rec.schema()['identifier'] == '010230-99999'
+
+
+def test_isdrecordfactory_parse_datestamp():
+    expected = datetime.datetime(2020, 1, 1, 4, 30, tzinfo=datetime.timezone.utc)
+    assert ISDRecordFactory.parse_datestamp('2020-01-01T04:30:00+00:00') == expected
+    assert ISDRecordFactory.parse_datestamp('2020-01-01 04:30') == expected
+    assert ISDRecordFactory.parse_datestamp('202001010430') == expected